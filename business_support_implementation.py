@@ -8,43 +8,162 @@ integrating with the database for sentiment analysis, news aggregation, and repo
 import sys
 import os
 import json
+import functools
+import re
+import threading
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
 import sqlite3 # Import sqlite3 for error handling
 
+# Prefer the standalone vaderSentiment package when installed: the same
+# algorithm as NLTK's wrapper but with lighter tokenization and no
+# nltk.data lookups per call. Fall back to NLTK (and its lexicon download
+# bootstrap) otherwise, so vaderSentiment stays an optional dependency.
+try:
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+except ImportError:
+    import nltk
+    from nltk.sentiment import SentimentIntensityAnalyzer
+
+    # Ensure NLTK resources are available
+    try:
+        nltk.data.find("vader_lexicon")
+    except LookupError:
+        print("NLTK vader_lexicon not found. Attempting download...")
+        try:
+            nltk.download("vader_lexicon", quiet=True)
+        except Exception as e:
+            print(f"Failed to download NLTK data: {e}")
+
 # Add project root to path for imports
 sys.path.append("/home/ubuntu")
 import database_manager as db_manager
 # from real_data_collector import RealDataCollector # May not be needed directly if data is in DB
 
-# Ensure NLTK resources are available
-try:
-    nltk.data.find("vader_lexicon")
-except LookupError:
-    print("NLTK vader_lexicon not found. Attempting download...")
-    try:
-        nltk.download("vader_lexicon", quiet=True)
-    except Exception as e:
-        print(f"Failed to download NLTK data: {e}")
+# Scoring a batch of summaries is pure-Python CPU work with no shared
+# mutable state, so batches at or above this size fan out across a process
+# pool; smaller ones stay sequential since the pool startup would cost more
+# than it saves.
+_PARALLEL_SCORE_THRESHOLD = 20
+
+# Topics shaped like ticker symbols (e.g. "INFY", "RELIANCE.NS") can skip
+# the substring/FTS search and hit the ticker_symbol index with a plain
+# equality lookup instead.
+_TICKER_RE = re.compile(r"^[A-Z0-9]{1,10}(\.[A-Z]+)?$")
+
+# One SQLite connection per thread, created on first use. WAL (enabled at
+# connect time) allows concurrent readers, but a single connection shared
+# across threads still serializes every cursor on it; giving each thread
+# its own lets independent queries actually overlap. An explicitly
+# supplied connection always takes precedence. SQLite still permits only
+# one writer at a time, so writers take _WRITE_LOCK.
+_thread_conn = threading.local()
+_WRITE_LOCK = threading.Lock()
+
+def _get_thread_conn():
+    conn = getattr(_thread_conn, "conn", None)
+    if conn is None:
+        conn = db_manager.get_db_connection()
+        _thread_conn.conn = conn
+    return conn
+
+# Label order used by the batch classifier below
+_SENTIMENT_LABELS = np.array(["positive", "negative", "neutral"])
+
+def _label_batch(compounds):
+    """Classifies an array of compound scores without per-element branches.
+
+    Returns int8 indices into _SENTIMENT_LABELS (0=positive, 1=negative,
+    2=neutral) using the same +/-0.05 thresholds as the scalar path; map
+    through _SENTIMENT_LABELS[labels] for the string form.
+    """
+    return np.where(compounds >= 0.05, 0,
+                    np.where(compounds <= -0.05, 1, 2)).astype(np.int8)
+
+# One SentimentIntensityAnalyzer for the whole process, built lazily on
+# first use. Constructing one means parsing the full VADER lexicon, and the
+# scorer itself holds no per-call state, so every analyzer instance can
+# share it. Double-checked locking keeps the common already-built path
+# lock-free while stopping two threads from parsing the lexicon at once.
+_SIA = None
+_SIA_LOCK = threading.Lock()
+
+def _get_sia():
+    """Returns the shared lazily-built SentimentIntensityAnalyzer."""
+    global _SIA
+    if _SIA is None:
+        with _SIA_LOCK:
+            if _SIA is None:
+                _SIA = SentimentIntensityAnalyzer()
+    return _SIA
+
+@functools.lru_cache(maxsize=4096)
+def _polarity_scores_cached(text):
+    """Memoized raw VADER scores; headlines repeat across sources and queries."""
+    return _get_sia().polarity_scores(text)
+
+# Each pool worker builds its own analyzer lazily on first use (module
+# globals are not shared across processes) and keeps it for every text it
+# scores afterwards.
+_worker_sia = None
+
+def _score_text(text):
+    """Scores one text; used as the process-pool map function."""
+    global _worker_sia
+    if _worker_sia is None:
+        _worker_sia = SentimentIntensityAnalyzer()
+    if not text or not isinstance(text, str):
+        return {"compound": 0.0, "neg": 0.0, "neu": 1.0, "pos": 0.0, "label": "neutral"}
+    scores = _worker_sia.polarity_scores(text)
+    if scores["compound"] >= 0.05:
+        scores["label"] = "positive"
+    elif scores["compound"] <= -0.05:
+        scores["label"] = "negative"
+    else:
+        scores["label"] = "neutral"
+    return scores
 
 class BusinessSupportAgent:
     """Main class for additional business support functionalities using real data."""
     
     def __init__(self, db_conn=None):
         """Initialize the Business Support Agent with a database connection."""
-        self.db_conn = db_conn if db_conn else db_manager.get_db_connection()
-        if not self.db_conn:
+        self._db_conn = db_conn
+        if not self.db_conn: # Resolves to this thread's connection when none was given
             raise ConnectionError("Failed to establish database connection.")
-            
-        self.sentiment_analyzer = EnhancedSentimentAnalyzer(self.db_conn)
-        self.news_aggregator = NewsAggregator(self.db_conn)
+
+        # Per-agent ticker -> company_id cache, so lookups always go
+        # through this agent's own database. Misses are cached too (as
+        # None) - clear it after inserting new companies.
+        self._ticker_ids = {}
+
+        # Components share the same explicit connection, or each resolve
+        # their calling thread's own when none was supplied
+        self.sentiment_analyzer = EnhancedSentimentAnalyzer(db_conn)
+        self.news_aggregator = NewsAggregator(db_conn)
         self.scheduler = BasicScheduler() # Keep file-based for now
-        self.auto_reporter = AutomatedReporter(self.db_conn)
+        self.auto_reporter = AutomatedReporter(db_conn)
         print("BusinessSupportAgent initialized with database connection.")
-        
+
+    @property
+    def db_conn(self):
+        """The explicit connection if one was given, else this thread's own."""
+        return self._db_conn if self._db_conn is not None else _get_thread_conn()
+
+    def _ticker_to_id(self, ticker):
+        """Resolves a ticker symbol to its company_id, cached per agent.
+
+        The same few tickers are resolved on every report and company-news
+        call, so after the first hit this is a dict lookup instead of a
+        query.
+        """
+        if ticker not in self._ticker_ids:
+            company = db_manager.get_company_by_ticker(self.db_conn, ticker)
+            self._ticker_ids[ticker] = company["company_id"] if company else None
+        return self._ticker_ids[ticker]
+
     def analyze_public_sentiment(self, topic, sources=["news"]):
         """Analyze public sentiment about a topic using data from the database."""
         print(f"Analyzing public sentiment for topic: {topic} from sources: {sources}")
@@ -65,10 +184,8 @@ class BusinessSupportAgent:
             
         _company_id = company_id
         if not _company_id and company_ticker:
-            company = db_manager.get_company_by_ticker(self.db_conn, company_ticker)
-            if company:
-                _company_id = company["company_id"]
-            else:
+            _company_id = self._ticker_to_id(company_ticker)
+            if _company_id is None:
                 return {"error": f"Company with ticker {company_ticker} not found."}
         
         print(f"Aggregating news for company ID: {_company_id}")
@@ -89,20 +206,20 @@ class BusinessSupportAgent:
         
         _company_id = company_id
         if not _company_id and company_ticker:
-            company = db_manager.get_company_by_ticker(self.db_conn, company_ticker)
-            if company:
-                _company_id = company["company_id"]
-            else:
+            _company_id = self._ticker_to_id(company_ticker)
+            if _company_id is None:
                 return {"error": f"Company with ticker {company_ticker} not found for report generation."}
         elif not _company_id:
              return {"error": "Must provide company_id or company_ticker for the main company."}
              
         competitor_ids = []
         if competitor_tickers:
+            # Resolve every competitor ticker in one query instead of one
+            # round-trip per ticker
+            companies = db_manager.get_companies_by_tickers(self.db_conn, competitor_tickers)
             for ticker in competitor_tickers:
-                comp = db_manager.get_company_by_ticker(self.db_conn, ticker)
-                if comp:
-                    competitor_ids.append(comp["company_id"])
+                if ticker in companies:
+                    competitor_ids.append(companies[ticker]["company_id"])
                 else:
                     print(f"Warning: Competitor ticker {ticker} not found in DB for report.")
                     
@@ -116,14 +233,22 @@ class BusinessSupportAgent:
 class EnhancedSentimentAnalyzer:
     """Component for performing sentiment analysis on text data from the database."""
     
-    def __init__(self, db_conn):
+    def __init__(self, db_conn=None):
         """Initialize the sentiment analyzer with DB connection."""
-        self.db_conn = db_conn
+        self._db_conn = db_conn
         try:
-            self.sia = SentimentIntensityAnalyzer()
+            # Shared module-level singleton: the VADER lexicon is only
+            # parsed once no matter how many analyzers get constructed
+            self.sia = _get_sia()
+            self._polarity_cached = _polarity_scores_cached
         except Exception as e:
             print(f"Error initializing SentimentIntensityAnalyzer: {e}")
             self.sia = None
+
+    @property
+    def db_conn(self):
+        """The explicit connection if one was given, else this thread's own."""
+        return self._db_conn if self._db_conn is not None else _get_thread_conn()
             
     def analyze_text_sentiment(self, text):
         """Analyze the sentiment of a single piece of text."""
@@ -135,7 +260,8 @@ class EnhancedSentimentAnalyzer:
             return {"compound": 0.0, "neg": 0.0, "neu": 1.0, "pos": 0.0, "label": "neutral"}
             
         try:
-            scores = self.sia.polarity_scores(text)
+            # Copy so the cached dict is never mutated by callers
+            scores = dict(self._polarity_cached(text))
             if scores["compound"] >= 0.05:
                 scores["label"] = "positive"
             elif scores["compound"] <= -0.05:
@@ -155,119 +281,243 @@ class EnhancedSentimentAnalyzer:
         if not texts_with_meta or not isinstance(texts_with_meta, list):
              return {"error": "Input must be a list of text dictionaries."}
              
-        results = []
-        for item in texts_with_meta:
-            text_to_analyze = item.get("summary", item.get("text", "")) # Adapt to news/social structure
-            sentiment = self.analyze_text_sentiment(text_to_analyze)
-            results.append({"data": item, "sentiment": sentiment})
-            
-        overall_sentiment = {"positive": 0, "negative": 0, "neutral": 0, "compound_sum": 0.0}
-        valid_analyses = 0
-        for res in results:
-            if "label" in res["sentiment"]:
-                overall_sentiment[res["sentiment"]["label"]] += 1
-                overall_sentiment["compound_sum"] += res["sentiment"]["compound"]
-                valid_analyses += 1
-                
-        average_compound = (overall_sentiment["compound_sum"] / valid_analyses) if valid_analyses > 0 else 0
-        
+        # Adapt to news/social structure
+        texts = [item.get("summary", item.get("text", "")) for item in texts_with_meta]
+
+        # Large batches are scored in parallel: the evaluations are
+        # independent, so they spread across a process pool near-linearly
+        if len(texts) >= _PARALLEL_SCORE_THRESHOLD and (os.cpu_count() or 1) > 1:
+            with ProcessPoolExecutor() as executor:
+                sentiments = list(executor.map(_score_text, texts, chunksize=16))
+        else:
+            sentiments = [self.analyze_text_sentiment(text) for text in texts]
+
+        results = [{"data": item, "sentiment": sentiment}
+                   for item, sentiment in zip(texts_with_meta, sentiments)]
+
+
+        # Aggregate with NumPy: one fromiter pass collects the compound
+        # scores, then counts and mean come from C-level ufuncs instead of
+        # a dict-lookup-and-branch loop per article
+        compounds = np.fromiter(
+            (res["sentiment"]["compound"] for res in results if "label" in res["sentiment"]),
+            dtype=np.float64)
+        valid_analyses = compounds.size
+        counts = np.bincount(_label_batch(compounds), minlength=3)
+        positive_count, negative_count, neutral_count = (int(n) for n in counts)
+        average_compound = float(compounds.mean()) if valid_analyses else 0
+
         return {
             "individual_results": results,
             "aggregate_summary": {
                 "total_analyzed": len(texts_with_meta),
-                "positive_count": overall_sentiment["positive"],
-                "negative_count": overall_sentiment["negative"],
-                "neutral_count": overall_sentiment["neutral"],
+                "positive_count": positive_count,
+                "negative_count": negative_count,
+                "neutral_count": neutral_count,
                 "average_compound_score": round(average_compound, 3)
             }
         }
 
     def analyze_topic_sentiment_from_db(self, topic, limit=50):
-        """Fetch news data from DB related to the topic and analyze sentiment."""
+        """Fetch news data from DB related to the topic and analyze sentiment.
+
+        Sentiment is cached in the news_articles sentiment columns: VADER
+        only runs on rows that have no stored score yet, and those scores
+        are written back so repeat queries on a topic skip the lexicon
+        scans entirely.
+        """
         print(f"Fetching news from DB for sentiment analysis on topic: {topic}")
         if not self.db_conn:
             return {"error": "Database connection not available."}
-            
+
         cursor = self.db_conn.cursor()
         articles = []
         try:
-            # Search for topic in title, summary, or as company name/ticker
-            # This is a basic search, could be improved with full-text search if using PostgreSQL etc.
-            cursor.execute("""
-                SELECT article_id, title, summary, published_date, source_name, source_url 
-                FROM news_articles 
-                WHERE company_id = (SELECT company_id FROM companies WHERE name LIKE ? OR ticker_symbol LIKE ?) 
-                   OR title LIKE ? 
-                   OR summary LIKE ? 
-                   OR topic LIKE ?
-                ORDER BY published_date DESC
-                LIMIT ?
-            """, (f"%{topic}%", f"%{topic}%", f"%{topic}%", f"%{topic}%", f"%{topic}%", limit))
-            results = cursor.fetchall()
-            articles = [dict(row) for row in results]
+            pattern = f"%{topic}%"
+            if _TICKER_RE.match(topic):
+                # Ticker-shaped topic: a plain equality lookup through the
+                # ticker_symbol index, no substring or FTS search needed.
+                # Ticker-shaped words that are not actually tickers ("AI",
+                # "ESG") resolve no company and fall through to the text
+                # search below instead of returning an empty result.
+                cursor.execute("""
+                    SELECT article_id, title, summary, published_date, source_name, source_url,
+                           sentiment_score, sentiment_label
+                    FROM news_articles
+                    WHERE company_id = (SELECT company_id FROM companies WHERE ticker_symbol = ?)
+                    ORDER BY published_date DESC
+                    LIMIT ?
+                """, (topic, limit))
+                articles = list(map(dict, cursor))
+            if not articles:
+                # Search for the topic through the FTS5 inverted index (plus a
+                # company name/ticker match); databases created before news_fts
+                # existed fall back to the old five-way LIKE scan
+                try:
+                    cursor.execute("""
+                        SELECT article_id, title, summary, published_date, source_name, source_url,
+                               sentiment_score, sentiment_label
+                        FROM news_articles
+                        WHERE article_id IN (SELECT rowid FROM news_fts WHERE news_fts MATCH ?)
+                           OR company_id IN (SELECT company_id FROM companies
+                                             WHERE name LIKE ? OR ticker_symbol LIKE ?)
+                        ORDER BY published_date DESC
+                        LIMIT ?
+                    """, ('"%s"' % topic.replace('"', '""'), pattern, pattern, limit))
+                except sqlite3.OperationalError:
+                    cursor.execute("""
+                        SELECT article_id, title, summary, published_date, source_name, source_url,
+                               sentiment_score, sentiment_label
+                        FROM news_articles
+                        WHERE company_id = (SELECT company_id FROM companies WHERE name LIKE ? OR ticker_symbol LIKE ?)
+                           OR title LIKE ?
+                           OR summary LIKE ?
+                           OR topic LIKE ?
+                        ORDER BY published_date DESC
+                        LIMIT ?
+                    """, (pattern, pattern, pattern, pattern, pattern, limit))
+                # One pass over the cursor builds the dicts directly; no
+                # intermediate Row list is materialized
+                articles = list(map(dict, cursor))
             print(f"Found {len(articles)} articles related to {topic} in DB.")
+
+            # Score only the articles without a stored sentiment and persist
+            # the new scores for the next query on this topic
+            updates = []
+            for article in articles:
+                if article["sentiment_score"] is None:
+                    sentiment = self.analyze_text_sentiment(article.get("summary") or article.get("title"))
+                    if "label" not in sentiment:
+                        continue
+                    article["sentiment_score"] = sentiment["compound"]
+                    article["sentiment_label"] = sentiment["label"]
+                    updates.append((sentiment["compound"], sentiment["label"], article["article_id"]))
+            if updates:
+                # Single-writer rule: serialize the write-back across threads
+                with _WRITE_LOCK:
+                    cursor.executemany(
+                        "UPDATE news_articles SET sentiment_score = ?, sentiment_label = ? WHERE article_id = ?",
+                        updates)
+                    self.db_conn.commit()
+                print(f"Cached sentiment for {len(updates)} newly scored articles.")
         except sqlite3.Error as e:
             print(f"Database error fetching news for sentiment analysis: {e}")
             return {"error": f"Database error: {e}"}
         finally:
             if cursor:
                 cursor.close()
-                
+
         if not articles:
             return {"error": f"No news articles found in the database for topic: {topic}"}
-            
-        # Analyze sentiment of the collected articles
-        return self.analyze_multiple_texts(articles)
+
+        # Aggregate from the (now fully scored) rows in one pass; the rows
+        # are already in hand, so this is cheaper than a second SQL scan of
+        # the same LIKE predicate
+        overall = {"positive": 0, "negative": 0, "neutral": 0}
+        compound_sum = 0.0
+        valid_analyses = 0
+        individual_results = []
+        for article in articles:
+            label = article["sentiment_label"]
+            if label in overall:
+                overall[label] += 1
+                compound_sum += article["sentiment_score"] or 0.0
+                valid_analyses += 1
+            individual_results.append({
+                "data": article,
+                "sentiment": {"compound": article["sentiment_score"], "label": label}
+            })
+        average_compound = (compound_sum / valid_analyses) if valid_analyses > 0 else 0
+
+        return {
+            "individual_results": individual_results,
+            "aggregate_summary": {
+                "total_analyzed": len(articles),
+                "positive_count": overall["positive"],
+                "negative_count": overall["negative"],
+                "neutral_count": overall["neutral"],
+                "average_compound_score": round(average_compound, 3)
+            }
+        }
 
 class NewsAggregator:
     """Component for aggregating news articles from the database."""
     
-    def __init__(self, db_conn):
-        self.db_conn = db_conn
+    def __init__(self, db_conn=None):
+        self._db_conn = db_conn
+
+    @property
+    def db_conn(self):
+        """The explicit connection if one was given, else this thread's own."""
+        return self._db_conn if self._db_conn is not None else _get_thread_conn()
+
+    # Canonical statement variants, picked by filter below. Constant SQL
+    # text keeps sqlite3's per-connection statement cache effective, which
+    # per-call string concatenation would defeat.
+    _SELECT = ("SELECT article_id, title, summary, published_date, source_name, "
+               "source_url, sentiment_score, sentiment_label FROM news_articles")
+    _ORDER = " ORDER BY published_date DESC LIMIT ?"
+    _SQL_ALL = _SELECT + _ORDER
+    _SQL_BY_COMPANY = _SELECT + " WHERE company_id = ?" + _ORDER
+    _SQL_BY_INDUSTRY = _SELECT + " WHERE industry = ?" + _ORDER
+
+    # Sentiment reduction over the same predicate, done in SQLite's C code
+    # instead of shipping every matching row to Python for counting
+    _AGG = ("SELECT AVG(sentiment_score) AS average_sentiment_score, "
+            "SUM(sentiment_label = 'positive') AS positive, "
+            "SUM(sentiment_label = 'negative') AS negative, "
+            "SUM(sentiment_label = 'neutral') AS neutral, "
+            "COUNT(*) AS total FROM news_articles")
+    _AGG_ALL = _AGG
+    _AGG_BY_COMPANY = _AGG + " WHERE company_id = ?"
+    _AGG_BY_INDUSTRY = _AGG + " WHERE industry = ?"
 
     def aggregate_news_from_db(self, industry=None, company_id=None, region=None, limit=10):
-        """Fetch and aggregate news articles from the database based on criteria."""
+        """Fetch and aggregate news articles from the database based on criteria.
+
+        Alongside the article list, returns an aggregate_summary computed
+        server-side over every article matching the same criteria (not just
+        the `limit` most recent ones returned).
+        """
         print(f"Aggregating news from DB (Industry: {industry}, CompanyID: {company_id}, Region: {region}, Limit: {limit})")
         if not self.db_conn:
             return {"error": "Database connection not available."}
-            
-        cursor = self.db_conn.cursor()
-        articles = []
-        query_parts = []
-        params = []
-        
-        sql = "SELECT article_id, title, summary, published_date, source_name, source_url, sentiment_score, sentiment_label FROM news_articles WHERE 1=1"
-        
+
         if company_id:
-            sql += " AND company_id = ?"
-            params.append(company_id)
+            sql, agg_sql, params = self._SQL_BY_COMPANY, self._AGG_BY_COMPANY, (company_id,)
         elif industry: # Only use industry if company_id is not specified
-            sql += " AND industry = ?"
-            params.append(industry)
-            # Optionally filter by region if industry is specified
-            # if region:
-            #    sql += " AND company_id IN (SELECT company_id FROM companies WHERE region = ?)" # Less efficient
-            #    params.append(region)
-
-        sql += " ORDER BY published_date DESC LIMIT ?"
-        params.append(limit)
-        
+            sql, agg_sql, params = self._SQL_BY_INDUSTRY, self._AGG_BY_INDUSTRY, (industry,)
+        else:
+            sql, agg_sql, params = self._SQL_ALL, self._AGG_ALL, ()
+
+        conn = self.db_conn
         try:
-            cursor.execute(sql, params)
-            results = cursor.fetchall()
-            articles = [dict(row) for row in results]
+            # Connections run in autocommit, so an explicit deferred
+            # transaction pins one WAL read snapshot across both queries -
+            # the summary and the article list then describe the same data
+            # without taking the writer lock. conn.execute uses an implicit
+            # cursor and one pass builds the dicts with no intermediate
+            # Row list.
+            own_txn = not conn.in_transaction
+            if own_txn:
+                conn.execute("BEGIN")
+            try:
+                articles = list(map(dict, conn.execute(sql, params + (limit,))))
+                summary = dict(conn.execute(agg_sql, params).fetchone())
+            finally:
+                if own_txn and conn.in_transaction:
+                    conn.execute("COMMIT")
             print(f"Found {len(articles)} articles matching criteria.")
         except sqlite3.Error as e:
             print(f"Database error aggregating news: {e}")
             return {"error": f"Database error: {e}"}
-        finally:
-            if cursor:
-                cursor.close()
-                
+
+
         return {
             "query": {"industry": industry, "company_id": company_id, "region": region},
             "aggregated_at": datetime.now().isoformat(),
-            "articles": articles
+            "articles": articles,
+            "aggregate_summary": summary
         }
 
 class BasicScheduler:
@@ -279,38 +529,73 @@ class BasicScheduler:
             self.reminder_file = os.path.join(os.path.dirname(__file__), "reminders.log")
         else:
             self.reminder_file = reminder_file
-            
+        self._fh = None # Append handle, opened lazily and reused
+
+    @staticmethod
+    def _parse_due_date(due_date_str):
+        """Parses an ISO datetime (or plain date) string; None when invalid."""
+        try:
+            return datetime.fromisoformat(due_date_str)
+        except ValueError:
+            try:
+                return datetime.strptime(due_date_str, "%Y-%m-%d")
+            except ValueError:
+                return None
+
+    def _append(self, line):
+        """Appends one log line through a handle opened once per scheduler."""
+        if self._fh is None:
+            self._fh = open(self.reminder_file, "a", buffering=8192)
+        self._fh.write(line)
+        self._fh.flush() # Keep view_reminders (and other readers) current
+
+    def close(self):
+        """Closes the append handle, flushing anything buffered."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __del__(self):
+        self.close()
+
     def add_reminder(self, task, due_date_str, notes=""):
+        # Parse the date once up front; the previous double try/except
+        # reopened the log file on the fallback path
+        due_date = self._parse_due_date(due_date_str)
+        if due_date is None:
+            print("Error: Invalid due date format. Please use ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS).")
+            return {"status": "error", "message": "Invalid due date format. Use YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS."}
         try:
-            due_date = datetime.fromisoformat(due_date_str)
             log_entry = f"{datetime.now().isoformat()} | DUE: {due_date.isoformat()} | TASK: {task} | NOTES: {notes}\n"
-            with open(self.reminder_file, "a") as f:
-                f.write(log_entry)
+            self._append(log_entry)
             print(f"Reminder logged to {self.reminder_file}")
             return {"status": "success", "message": f"Reminder for {task} logged.", "log_entry": log_entry.strip()}
-        except ValueError:
-            print(f"Error: Invalid due date format. Please use ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS).")
-            # Try parsing date only
-            try:
-                due_date = datetime.strptime(due_date_str, "%Y-%m-%d")
-                log_entry = f"{datetime.now().isoformat()} | DUE: {due_date.isoformat()} | TASK: {task} | NOTES: {notes}\n"
-                with open(self.reminder_file, "a") as f:
-                    f.write(log_entry)
-                print(f"Reminder logged to {self.reminder_file}")
-                return {"status": "success", "message": f"Reminder for {task} logged.", "log_entry": log_entry.strip()}
-            except ValueError:
-                 return {"status": "error", "message": "Invalid due date format. Use YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS."}
         except Exception as e:
             print(f"Error logging reminder: {e}")
             return {"status": "error", "message": f"Failed to log reminder: {e}"}
 
+    @staticmethod
+    def _tail_lines(path, n, block_size=4096):
+        """Returns the last n lines of a file without reading all of it."""
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            data = b""
+            # Read backwards in blocks until enough newlines are in hand
+            while pos > 0 and data.count(b"\n") <= n:
+                step = min(block_size, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+        lines = data.decode("utf-8", errors="replace").splitlines()
+        return [line.strip() for line in lines[-n:]]
+
     def view_reminders(self, limit=10):
         try:
             if not os.path.exists(self.reminder_file):
                 return {"status": "success", "reminders": [], "message": "No reminders logged yet."}
-            with open(self.reminder_file, "r") as f:
-                lines = f.readlines()
-            recent_reminders = [line.strip() for line in lines[-limit:]]
+            # Tail-read the log: cost stays constant as the file grows
+            recent_reminders = self._tail_lines(self.reminder_file, limit)
             recent_reminders.reverse()
             return {"status": "success", "reminders": recent_reminders}
         except Exception as e:
@@ -320,8 +605,77 @@ class BasicScheduler:
 class AutomatedReporter:
     """Component for generating automated summary reports using database data."""
     
-    def __init__(self, db_conn):
-        self.db_conn = db_conn
+    def __init__(self, db_conn=None):
+        self._db_conn = db_conn
+
+    @property
+    def db_conn(self):
+        """The explicit connection if one was given, else this thread's own."""
+        return self._db_conn if self._db_conn is not None else _get_thread_conn()
+
+    def _market_section(self, industry, region):
+        """Market summary for the last 7 days; safe to run on a worker thread."""
+        market_summary = {"key_trends": [], "overall_sentiment": "N/A", "sentiment_article_count": 0}
+        if not industry:
+            return market_summary
+        conn = self.db_conn
+        # Get recent trends for the industry
+        trends = conn.execute("""
+            SELECT trend_description, sentiment_score FROM market_trends
+            WHERE industry = ? AND region = ? AND published_date >= date("now", "-7 days")
+            ORDER BY published_date DESC LIMIT 3
+        """, (industry, region)).fetchall()
+        market_summary["key_trends"] = [f"{row['trend_description']} (Sentiment: {row['sentiment_score']:.2f})" for row in trends]
+
+        # Get recent industry sentiment from news
+        industry_sentiment = conn.execute("""
+            SELECT AVG(sentiment_score) as avg_sent, COUNT(*) as count
+            FROM news_articles
+            WHERE industry = ? AND published_date >= date("now", "-7 days")
+        """, (industry,)).fetchone()
+        if industry_sentiment and industry_sentiment["count"] > 0:
+            market_summary["overall_sentiment"] = f"{industry_sentiment['avg_sent']:.2f}"
+            market_summary["sentiment_article_count"] = industry_sentiment["count"]
+        return market_summary
+
+    def _competitor_section(self, competitor_ids):
+        """Competitor activity for the last 7 days; safe to run on a worker thread."""
+        placeholders = ",".join(["?"] * len(competitor_ids))
+        # Count recent news per competitor in SQL: only one row per
+        # company crosses into Python instead of every headline
+        comp_activity = [f"{row['name']}: {row['article_count']} recent news articles found."
+                         for row in self.db_conn.execute(f"""
+                             SELECT c.name, COUNT(*) AS article_count
+                             FROM news_articles na JOIN companies c ON na.company_id = c.company_id
+                             WHERE na.company_id IN ({placeholders}) AND na.published_date >= date("now", "-7 days")
+                             GROUP BY c.name ORDER BY c.name
+                         """, competitor_ids)]
+
+        if not comp_activity:
+            comp_activity.append("No significant competitor news found in the last 7 days.")
+        return {"summary": comp_activity}
+
+    def _lead_section(self):
+        """Lead generation summary for the last 7 days; safe to run on a worker thread."""
+        lead_summary = {"new_qualified_leads": 0, "top_lead_source": "N/A", "average_lead_score": 0.0}
+        # Total count, average score and top source over the leads
+        # qualified in the last 7 days come back in one round-trip;
+        # the CTE filters the set once instead of three separate scans
+        recent_leads = self.db_conn.execute("""
+            WITH recent AS (
+                SELECT source, score FROM leads
+                WHERE qualification_status = 'Qualified' AND collected_date >= date('now', '-7 days')
+            )
+            SELECT (SELECT COUNT(*) FROM recent) AS total,
+                   (SELECT AVG(score) FROM recent) AS avg_score,
+                   (SELECT source FROM recent GROUP BY source ORDER BY COUNT(*) DESC LIMIT 1) AS top_source
+        """).fetchone()
+        if recent_leads and recent_leads["total"]:
+            lead_summary["new_qualified_leads"] = recent_leads["total"]
+            lead_summary["top_lead_source"] = recent_leads["top_source"]
+            if recent_leads["avg_score"] is not None:
+                lead_summary["average_lead_score"] = round(recent_leads["avg_score"], 2)
+        return lead_summary
 
     def generate_summary_report(self, report_type, company_id, competitor_ids=None, region="IN"):
         """Generate a summary report using data queried from the database."""
@@ -351,81 +705,21 @@ class AutomatedReporter:
                 print(f"Warning: Company ID {company_id} not found for report generation.")
                 return {"error": f"Company ID {company_id} not found."}
 
-            # --- Market Summary Section ---
-            market_summary = {"key_trends": [], "overall_sentiment": "N/A", "sentiment_article_count": 0}
-            if company_industry:
-                # Get recent trends for the industry
-                cursor.execute("""
-                    SELECT trend_description, sentiment_score FROM market_trends 
-                    WHERE industry = ? AND region = ? AND published_date >= date("now", "-7 days")
-                    ORDER BY published_date DESC LIMIT 3
-                """, (company_industry, region))
-                trends = cursor.fetchall()
-                market_summary["key_trends"] = [f"{row['trend_description']} (Sentiment: {row['sentiment_score']:.2f})" for row in trends]
-                
-                # Get recent industry sentiment from news
-                cursor.execute("""
-                    SELECT AVG(sentiment_score) as avg_sent, COUNT(*) as count 
-                    FROM news_articles 
-                    WHERE industry = ? AND published_date >= date("now", "-7 days")
-                """, (company_industry,))
-                industry_sentiment = cursor.fetchone()
-                if industry_sentiment and industry_sentiment["count"] > 0:
-                    market_summary["overall_sentiment"] = f"{industry_sentiment['avg_sent']:.2f}"
-                    market_summary["sentiment_article_count"] = industry_sentiment["count"]
-            report["sections"].append({"title": "Market Summary (Last 7 Days)", "content": market_summary})
-
-            # --- Competitor Activity Section ---
-            if competitor_ids:
-                comp_activity = []
-                placeholders = ",".join(["?"] * len(competitor_ids))
-                # Get recent news headlines for competitors
-                cursor.execute(f"""
-                    SELECT c.name, na.title, na.sentiment_label 
-                    FROM news_articles na JOIN companies c ON na.company_id = c.company_id
-                    WHERE na.company_id IN ({placeholders}) AND na.published_date >= date("now", "-7 days")
-                    ORDER BY c.name, na.published_date DESC
-                """, competitor_ids)
-                comp_news = cursor.fetchall()
-                # Simple summary
-                current_comp = ""
-                news_count = 0
-                for row in comp_news:
-                    if row["name"] != current_comp:
-                        if current_comp: comp_activity.append(f"{current_comp}: {news_count} recent news articles found.")
-                        current_comp = row["name"]
-                        news_count = 0
-                    news_count += 1
-                if current_comp: comp_activity.append(f"{current_comp}: {news_count} recent news articles found.")
-                
-                if not comp_activity:
-                    comp_activity.append("No significant competitor news found in the last 7 days.")
-                    
-                report["sections"].append({"title": "Competitor Activity (Last 7 Days)", "content": {"summary": comp_activity}})
-
-            # --- Lead Generation Summary Section ---
-            lead_summary = {"new_qualified_leads": 0, "top_lead_source": "N/A", "average_lead_score": 0.0}
-            # Get leads qualified in the last 7 days for any ICP
-            cursor.execute("""
-                SELECT COUNT(*) as count, AVG(score) as avg_score, source 
-                FROM leads 
-                WHERE qualification_status = 'Qualified' AND collected_date >= date('now', '-7 days')
-                GROUP BY source ORDER BY count DESC LIMIT 1
-            """,)
-            recent_leads = cursor.fetchone()
-            if recent_leads:
-                 # Need total count separately
-                 cursor.execute("SELECT COUNT(*) FROM leads WHERE qualification_status = 'Qualified' AND collected_date >= date('now', '-7 days')")
-                 total_count = cursor.fetchone()[0]
-                 lead_summary["new_qualified_leads"] = total_count
-                 lead_summary["top_lead_source"] = recent_leads["source"]
-                 # Avg score needs to be calculated across all recent qualified leads
-                 cursor.execute("SELECT AVG(score) FROM leads WHERE qualification_status = 'Qualified' AND collected_date >= date('now', '-7 days')")
-                 avg_score_res = cursor.fetchone()
-                 if avg_score_res and avg_score_res[0] is not None:
-                     lead_summary["average_lead_score"] = round(avg_score_res[0], 2)
-                     
-            report["sections"].append({"title": "Lead Generation Summary (Last 7 Days)", "content": lead_summary})
+            # The three sections below are independent read-only queries, so
+            # run them concurrently: under WAL each worker thread reads on its
+            # own connection and sqlite3 releases the GIL while a statement
+            # executes. Results are assembled in the fixed section order
+            # regardless of which query finishes first.
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                market_future = executor.submit(self._market_section, company_industry, region)
+                competitor_future = (executor.submit(self._competitor_section, competitor_ids)
+                                     if competitor_ids else None)
+                lead_future = executor.submit(self._lead_section)
+
+                report["sections"].append({"title": "Market Summary (Last 7 Days)", "content": market_future.result()})
+                if competitor_future:
+                    report["sections"].append({"title": "Competitor Activity (Last 7 Days)", "content": competitor_future.result()})
+                report["sections"].append({"title": "Lead Generation Summary (Last 7 Days)", "content": lead_future.result()})
 
             # --- Action Items Section (Placeholder) ---
             action_items = {"items": [
@@ -7,244 +7,434 @@ Provides functions for creating tables, inserting, updating, and querying data.
 
 import sqlite3
 import json
-from datetime import datetime
+import logging
+import queue
+from contextlib import contextmanager
+from datetime import date, datetime
+from itertools import islice
 import os
 
+# Bind datetime/date parameters through isoformat directly. This replaces
+# the implicit adapters (deprecated since Python 3.12) and skips the
+# per-value Python-side strftime work: isoformat runs in C and the value is
+# handed to SQLite as text in one step.
+sqlite3.register_adapter(datetime, datetime.isoformat)
+sqlite3.register_adapter(date, date.isoformat)
+
+# Per-row progress messages go through this logger at DEBUG level. With the
+# default NullHandler they cost nothing in hot insert loops; attach a handler
+# (or basicConfig) to see them.
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
 # Changed to a relative path for compatibility across Windows and Linux
 DATABASE_NAME = os.path.join(os.path.dirname(__file__), "business_agent.db")
 
+# Column orders used by the bulk insert helpers. Hoisted to module level so
+# the dict -> tuple projection is defined once and callers can pre-marshal
+# rows in the same order (SoA-style) instead of paying per-row dict rebuilds.
+COMPANY_COLUMNS = (
+    'name', 'ticker_symbol', 'region', 'industry', 'sector', 'website',
+    'address', 'phone', 'employee_count', 'business_summary', 'market_cap',
+    'revenue', 'growth_rate', 'profit_margin', 'innovativeness_score',
+    'hiring_score', 'sustainability_score', 'insider_sentiment_score',
+    'data_source', 'last_updated'
+)
+FIRM_COLUMNS = (
+    'company_id', 'firm_name', 'city', 'region', 'specialization',
+    'notable_projects', 'key_personnel', 'awards', 'coa_registration_id',
+    'source_url', 'collected_date'
+)
+PROJECT_COLUMNS = (
+    'project_name', 'developer_id', 'developer_name', 'city', 'region',
+    'project_type', 'status', 'rera_registration_id', 'launch_date',
+    'expected_completion_date', 'total_area_sqft', 'price_per_sqft_range',
+    'key_features', 'source_url', 'collected_date'
+)
+NEWS_ARTICLE_COLUMNS = (
+    'company_id', 'industry', 'topic', 'title', 'source_name', 'source_url',
+    'published_date', 'summary', 'sentiment_score', 'sentiment_label',
+    'collected_date'
+)
+
+# Non-unique secondary indexes. Kept as (name, column spec) pairs so bulk
+# loaders can drop them before a large insert and rebuild them once at the
+# end, which is cheaper than maintaining each index row-by-row.
+SECONDARY_INDEXES = (
+    ("idx_companies_name", "companies (name)"),
+    ("idx_companies_ticker", "companies (ticker_symbol)"),
+    ("idx_companies_industry", "companies (industry)"),
+    ("idx_leads_icp_id", "leads (icp_id)"),
+    ("idx_leads_industry", "leads (industry)"),
+    # Composite indexes matching the hot predicates + ORDER BY of the news
+    # aggregation and report queries, so those run as index range scans
+    # instead of table scans
+    ("idx_news_articles_company_date", "news_articles (company_id, published_date DESC)"),
+    ("idx_news_articles_industry_date", "news_articles (industry, published_date DESC)"),
+    ("idx_news_articles_published_date", "news_articles (published_date)"),
+    ("idx_leads_qual_date", "leads (qualification_status, collected_date DESC)"),
+    ("idx_market_trends_industry_region_date", "market_trends (industry, region, published_date DESC)"),
+    ("idx_india_real_estate_city", "india_real_estate_projects (city)"),
+    ("idx_india_arch_firms_city", "india_architectural_firms (city)"),
+)
+
+def create_secondary_indexes(conn):
+    """(Re)creates all non-unique secondary indexes and refreshes statistics."""
+    for name, spec in SECONDARY_INDEXES:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {spec};")
+    # Refresh planner statistics so the new indexes actually get picked
+    conn.execute("ANALYZE;")
+
+def drop_secondary_indexes(conn):
+    """Drops the non-unique secondary indexes, e.g. around a bulk load."""
+    for name, _ in SECONDARY_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name};")
+
+# Small pool of idle, already-configured connections. Opening a SQLite
+# connection repeats the open() syscall sequence, the PRAGMA setup below
+# and starts with a cold page cache, so request-heavy callers should hand
+# connections back with release_db_connection instead of closing them.
+# Existing callers that close() their connection keep working; those
+# connections simply are not reused.
+_POOL = queue.Queue(maxsize=4)
+
+def release_db_connection(conn):
+    """Returns a connection to the idle pool for reuse.
+
+    Any transaction still open on the connection is rolled back first so the
+    next user starts clean. When the pool is full (or the connection was
+    already closed) the connection is simply closed.
+    """
+    if conn is None:
+        return
+    try:
+        conn.rollback() # Drop any open transaction before reuse
+        _POOL.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+    except sqlite3.ProgrammingError:
+        pass # Already closed; nothing to pool
+
 def get_db_connection():
-    """Establishes a connection to the SQLite database."""
+    """Establishes a connection to the SQLite database.
+
+    Reuses a pooled connection when one is available (warm page cache,
+    PRAGMAs already applied); otherwise opens and configures a new one. The
+    connection runs in autocommit mode (isolation_level=None): single
+    statements commit immediately and multi-statement work is grouped with an
+    explicit BEGIN IMMEDIATE / COMMIT, so sqlite3 never holds a transaction
+    open implicitly. check_same_thread=False allows worker threads to use
+    connections they did not create (each bulk loader still opens its own).
+    """
+    while True:
+        try:
+            conn = _POOL.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            conn.execute("PRAGMA user_version;") # Liveness check
+            return conn
+        except sqlite3.ProgrammingError:
+            continue # Closed by its last user after release; discard
+
     conn = None
     try:
-        conn = sqlite3.connect(DATABASE_NAME)
+        # A larger statement cache (default 128) keeps the parsed form of the
+        # repeated INSERT/SELECT statements used by the helpers below.
+        conn = sqlite3.connect(DATABASE_NAME, cached_statements=512,
+                               isolation_level=None, check_same_thread=False)
         conn.row_factory = sqlite3.Row # Return rows as dictionary-like objects
         conn.execute("PRAGMA foreign_keys = ON;") # Enforce foreign key constraints
+        # Every consumer of this connection is read-heavy or bulk-writing,
+        # so tune it here once: WAL lets readers run alongside a writer and
+        # halves the fsyncs per transaction (NORMAL synchronous is safe
+        # under WAL), and the larger page cache plus mmap keep repeated
+        # scans in memory. Filesystems that reject WAL (e.g. some network
+        # mounts) silently keep the default journal.
+        conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            PRAGMA mmap_size=268435456;
+        """)
         print(f"Database connection established to {DATABASE_NAME}")
     except sqlite3.Error as e:
         print(f"Error connecting to database: {e}")
     return conn
 
+@contextmanager
+def transaction(conn):
+    """Groups many add_/update_ calls into one explicit transaction.
+
+    BEGIN IMMEDIATE takes the write lock up front so the batch never has to
+    upgrade mid-way. While the transaction is open, the helpers in this
+    module skip their own commits and re-raise errors instead of swallowing
+    them, so the whole batch commits or rolls back as a unit:
+
+        with transaction(conn):
+            for article in articles:
+                add_news_article(conn, article)
+
+    Outside a transaction every helper keeps its old commit-per-call
+    behavior (the connection runs in autocommit mode).
+    """
+    conn.execute("BEGIN IMMEDIATE;")
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+# The whole relational schema as one script. Feeding it to a single
+# executescript call inside one transaction replaces ~10 separate
+# prepare/step round trips through the Python/SQLite boundary with one.
+SCHEMA_DDL = """
+BEGIN;
+CREATE TABLE IF NOT EXISTS companies (
+    company_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    ticker_symbol TEXT UNIQUE,
+    region TEXT,
+    industry TEXT,
+    sector TEXT,
+    website TEXT,
+    address TEXT,
+    phone TEXT,
+    employee_count INTEGER,
+    business_summary TEXT,
+    market_cap REAL,
+    revenue REAL,
+    growth_rate REAL,
+    profit_margin REAL,
+    innovativeness_score REAL,
+    hiring_score REAL,
+    sustainability_score REAL,
+    insider_sentiment_score REAL,
+    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    data_source TEXT
+);
+
+CREATE TABLE IF NOT EXISTS company_officers (
+    officer_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company_id INTEGER NOT NULL,
+    name TEXT,
+    title TEXT,
+    age INTEGER,
+    year_born INTEGER,
+    fiscal_year INTEGER,
+    total_pay REAL,
+    exercised_value REAL,
+    unexercised_value REAL,
+    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (company_id) REFERENCES companies (company_id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS market_trends (
+    trend_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    industry TEXT,
+    region TEXT,
+    trend_description TEXT NOT NULL,
+    trend_type TEXT,
+    source TEXT,
+    source_url TEXT,
+    published_date DATE,
+    collected_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    sentiment_score REAL,
+    relevance_score REAL
+);
+
+CREATE TABLE IF NOT EXISTS news_articles (
+    article_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company_id INTEGER,
+    industry TEXT,
+    topic TEXT,
+    title TEXT NOT NULL,
+    source_name TEXT,
+    source_url TEXT UNIQUE NOT NULL,
+    published_date TIMESTAMP,
+    summary TEXT,
+    sentiment_score REAL,
+    sentiment_label TEXT,
+    collected_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (company_id) REFERENCES companies (company_id) ON DELETE SET NULL
+);
+
+CREATE TABLE IF NOT EXISTS icps (
+    icp_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    profile_name TEXT NOT NULL UNIQUE,
+    criteria_json TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_used TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS leads (
+    lead_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    icp_id INTEGER,
+    company_name TEXT,
+    contact_name TEXT,
+    job_title TEXT,
+    industry TEXT,
+    company_size TEXT,
+    region TEXT,
+    website TEXT,
+    email TEXT,
+    phone TEXT,
+    linkedin_profile TEXT,
+    source TEXT,
+    qualification_status TEXT,
+    qualification_reason TEXT,
+    score REAL,
+    engagement_level REAL,
+    technologies_used TEXT,
+    notes TEXT,
+    collected_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_contacted TIMESTAMP,
+    status TEXT DEFAULT 'New',
+    FOREIGN KEY (icp_id) REFERENCES icps (icp_id) ON DELETE SET NULL
+);
+
+CREATE TABLE IF NOT EXISTS india_real_estate_projects (
+    project_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_name TEXT NOT NULL,
+    developer_id INTEGER,
+    developer_name TEXT,
+    city TEXT,
+    region TEXT,
+    project_type TEXT,
+    status TEXT,
+    rera_registration_id TEXT UNIQUE,
+    launch_date DATE,
+    expected_completion_date DATE,
+    total_area_sqft REAL,
+    price_per_sqft_range TEXT,
+    key_features TEXT,
+    source_url TEXT,
+    collected_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (developer_id) REFERENCES companies (company_id) ON DELETE SET NULL
+);
+
+CREATE TABLE IF NOT EXISTS india_architectural_firms (
+    firm_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company_id INTEGER UNIQUE,
+    firm_name TEXT NOT NULL,
+    city TEXT,
+    region TEXT,
+    specialization TEXT,
+    notable_projects TEXT,
+    key_personnel TEXT,
+    awards TEXT,
+    coa_registration_id TEXT,
+    source_url TEXT,
+    collected_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (company_id) REFERENCES companies (company_id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS analysis_results (
+    result_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    analysis_type TEXT NOT NULL,
+    target_entity_id INTEGER,
+    target_entity_name TEXT,
+    result_json TEXT NOT NULL,
+    generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_india_projects_name_developer
+    ON india_real_estate_projects (project_name, developer_name);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_india_firms_name
+    ON india_architectural_firms (firm_name);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_india_firms_coa
+    ON india_architectural_firms (coa_registration_id);
+COMMIT;
+"""
+
+# Full-text index over the searchable news text. An external-content
+# FTS5 table stores only the inverted index (the text stays in
+# news_articles), with triggers keeping it in sync; topic search
+# then becomes an index lookup instead of a LIKE scan. Kept separate
+# from SCHEMA_DDL because builds of SQLite without FTS5 must be able
+# to skip it - readers fall back to LIKE.
+FTS_DDL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(
+    title, summary, topic,
+    content='news_articles', content_rowid='article_id'
+);
+CREATE TRIGGER IF NOT EXISTS news_fts_ai AFTER INSERT ON news_articles BEGIN
+    INSERT INTO news_fts(rowid, title, summary, topic)
+    VALUES (new.article_id, new.title, new.summary, new.topic);
+END;
+CREATE TRIGGER IF NOT EXISTS news_fts_ad AFTER DELETE ON news_articles BEGIN
+    INSERT INTO news_fts(news_fts, rowid, title, summary, topic)
+    VALUES ('delete', old.article_id, old.title, old.summary, old.topic);
+END;
+CREATE TRIGGER IF NOT EXISTS news_fts_au AFTER UPDATE ON news_articles BEGIN
+    INSERT INTO news_fts(news_fts, rowid, title, summary, topic)
+    VALUES ('delete', old.article_id, old.title, old.summary, old.topic);
+    INSERT INTO news_fts(rowid, title, summary, topic)
+    VALUES (new.article_id, new.title, new.summary, new.topic);
+END;
+-- Backfill the index from existing news_articles rows; idempotent, so
+-- re-running create_tables on a populated database is safe.
+INSERT INTO news_fts(news_fts) VALUES('rebuild');
+"""
+
 def create_tables(conn):
-    """Creates all necessary tables if they don't exist."""
+    """Creates all necessary tables and indexes if they don't exist.
+
+    The core schema runs as one executescript call inside one transaction
+    instead of a prepare/step cycle per statement.
+    """
     if not conn:
         return
-        
-    cursor = conn.cursor()
+
     try:
-        # Companies Table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS companies (
-            company_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL UNIQUE,
-            ticker_symbol TEXT UNIQUE,
-            region TEXT,
-            industry TEXT,
-            sector TEXT,
-            website TEXT,
-            address TEXT,
-            phone TEXT,
-            employee_count INTEGER,
-            business_summary TEXT,
-            market_cap REAL,
-            revenue REAL,
-            growth_rate REAL,
-            profit_margin REAL,
-            innovativeness_score REAL,
-            hiring_score REAL,
-            sustainability_score REAL,
-            insider_sentiment_score REAL,
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            data_source TEXT
-        );
-        """)
-        print("Checked/Created companies table.")
-
-        # Company Officers Table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS company_officers (
-            officer_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            company_id INTEGER NOT NULL,
-            name TEXT,
-            title TEXT,
-            age INTEGER,
-            year_born INTEGER,
-            fiscal_year INTEGER,
-            total_pay REAL,
-            exercised_value REAL,
-            unexercised_value REAL,
-            last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (company_id) REFERENCES companies (company_id) ON DELETE CASCADE
-        );
-        """)
-        print("Checked/Created company_officers table.")
-
-        # Market Trends Table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS market_trends (
-            trend_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            industry TEXT,
-            region TEXT,
-            trend_description TEXT NOT NULL,
-            trend_type TEXT,
-            source TEXT,
-            source_url TEXT,
-            published_date DATE,
-            collected_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            sentiment_score REAL,
-            relevance_score REAL
-        );
-        """)
-        print("Checked/Created market_trends table.")
-
-        # News Articles Table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS news_articles (
-            article_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            company_id INTEGER,
-            industry TEXT,
-            topic TEXT,
-            title TEXT NOT NULL,
-            source_name TEXT,
-            source_url TEXT UNIQUE NOT NULL,
-            published_date TIMESTAMP,
-            summary TEXT,
-            sentiment_score REAL,
-            sentiment_label TEXT,
-            collected_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (company_id) REFERENCES companies (company_id) ON DELETE SET NULL
-        );
-        """)
-        print("Checked/Created news_articles table.")
-
-        # ICPs Table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS icps (
-            icp_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            profile_name TEXT NOT NULL UNIQUE,
-            criteria_json TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            last_used TIMESTAMP
-        );
-        """)
-        print("Checked/Created icps table.")
-
-        # Leads Table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS leads (
-            lead_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            icp_id INTEGER,
-            company_name TEXT,
-            contact_name TEXT,
-            job_title TEXT,
-            industry TEXT,
-            company_size TEXT,
-            region TEXT,
-            website TEXT,
-            email TEXT,
-            phone TEXT,
-            linkedin_profile TEXT,
-            source TEXT,
-            qualification_status TEXT,
-            qualification_reason TEXT,
-            score REAL,
-            engagement_level REAL,
-            technologies_used TEXT,
-            notes TEXT,
-            collected_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            last_contacted TIMESTAMP,
-            status TEXT DEFAULT 'New',
-            FOREIGN KEY (icp_id) REFERENCES icps (icp_id) ON DELETE SET NULL
-        );
-        """)
-        print("Checked/Created leads table.")
-
-        # India Real Estate Projects Table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS india_real_estate_projects (
-            project_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            project_name TEXT NOT NULL,
-            developer_id INTEGER,
-            developer_name TEXT,
-            city TEXT,
-            region TEXT,
-            project_type TEXT,
-            status TEXT,
-            rera_registration_id TEXT UNIQUE,
-            launch_date DATE,
-            expected_completion_date DATE,
-            total_area_sqft REAL,
-            price_per_sqft_range TEXT,
-            key_features TEXT,
-            source_url TEXT,
-            collected_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (developer_id) REFERENCES companies (company_id) ON DELETE SET NULL
-        );
-        """)
-        print("Checked/Created india_real_estate_projects table.")
-
-        # India Architectural Firms Table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS india_architectural_firms (
-            firm_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            company_id INTEGER UNIQUE,
-            firm_name TEXT NOT NULL,
-            city TEXT,
-            region TEXT,
-            specialization TEXT,
-            notable_projects TEXT,
-            key_personnel TEXT,
-            awards TEXT,
-            coa_registration_id TEXT,
-            source_url TEXT,
-            collected_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (company_id) REFERENCES companies (company_id) ON DELETE CASCADE
-        );
-        """)
-        print("Checked/Created india_architectural_firms table.")
-
-        # Analysis Results Table
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS analysis_results (
-            result_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            analysis_type TEXT NOT NULL,
-            target_entity_id INTEGER,
-            target_entity_name TEXT,
-            result_json TEXT NOT NULL,
-            generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        """)
-        print("Checked/Created analysis_results table.")
+        conn.executescript(SCHEMA_DDL)
+        print("Checked/Created core tables.")
+
+        try:
+            conn.executescript(FTS_DDL)
+            print("Checked/Created news_fts full-text index.")
+        except sqlite3.OperationalError as e:
+            print(f"Note: FTS5 not available, topic search will use LIKE ({e}).")
 
         # Create Indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_companies_name ON companies (name);")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_companies_ticker ON companies (ticker_symbol);")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_companies_industry ON companies (industry);")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_leads_icp_id ON leads (icp_id);")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_leads_industry ON leads (industry);")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_articles_company_id ON news_articles (company_id);")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_articles_published_date ON news_articles (published_date);")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_market_trends_industry ON market_trends (industry);")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_india_real_estate_city ON india_real_estate_projects (city);")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_india_arch_firms_city ON india_architectural_firms (city);")
+        create_secondary_indexes(conn)
         print("Checked/Created indexes.")
 
-        conn.commit()
         print("Database schema created/verified successfully.")
     except sqlite3.Error as e:
         print(f"Error creating tables: {e}")
         conn.rollback()
-    finally:
-        if cursor:
-            cursor.close()
 
-def add_or_update_company(conn, company_data):
-    """Adds a new company or updates an existing one based on name or ticker_symbol."""
+# Canonical fixed-column statements for companies. One SQL text per table
+# means the per-connection statement cache (sized up to 512 at connect
+# time) hits on every call, instead of re-parsing a different text whenever
+# the input dict's key set changes; absent fields simply bind as NULL.
+_COMPANY_INSERT_SQL = (f"INSERT INTO companies ({', '.join(COMPANY_COLUMNS)}) "
+                       f"VALUES ({', '.join('?' * (len(COMPANY_COLUMNS) - 1))}, "
+                       f"COALESCE(?, CURRENT_TIMESTAMP))")
+# OR IGNORE (rather than a second, catch-all ON CONFLICT clause) swallows
+# ticker_symbol collisions: stacked ON CONFLICT clauses need SQLite >= 3.35,
+# while this form works on the 3.24+ found with any supported Python.
+_COMPANY_UPSERT_SQL = (_COMPANY_INSERT_SQL.replace("INSERT INTO", "INSERT OR IGNORE INTO", 1)
+                       + " ON CONFLICT(name) DO UPDATE SET "
+                       + ', '.join(f"{col} = excluded.{col}" for col in COMPANY_COLUMNS if col != 'name'))
+
+def add_or_update_company(conn, company_data, commit=True, cursor=None):
+    """Adds a new company or updates an existing one based on name or ticker_symbol.
+
+    Set commit=False when the caller manages an explicit transaction around
+    several inserts (e.g. bulk seed scripts); errors are then re-raised so the
+    caller can roll back the whole batch. Callers looping over many companies
+    can pass a shared cursor to avoid creating one per row.
+    """
     if not conn:
         return None
-        
-    cursor = conn.cursor()
-    now = datetime.now()
+
+    own_cursor = cursor is None
+    if own_cursor:
+        cursor = conn.cursor()
     company_id = None
     
     # Define columns based on the table schema
@@ -258,7 +448,6 @@ def add_or_update_company(conn, company_data):
     
     # Prepare data dictionary with only valid columns
     data_to_insert = {col: company_data.get(col) for col in columns if col in company_data}
-    data_to_insert['last_updated'] = now
     
     # Check if company exists by ticker symbol or name
     existing_id = None
@@ -278,132 +467,171 @@ def add_or_update_company(conn, company_data):
         if existing_id:
             # Update existing company
             company_id = existing_id
+            # last_updated comes from CURRENT_TIMESTAMP server-side instead
+            # of an adapted Python datetime
             update_cols = [f"{col} = ?" for col in data_to_insert.keys()]
-            sql = f"UPDATE companies SET {', '.join(update_cols)} WHERE company_id = ?"
+            sql = (f"UPDATE companies SET {', '.join(update_cols)}, "
+                   f"last_updated = CURRENT_TIMESTAMP WHERE company_id = ?")
             values = list(data_to_insert.values()) + [company_id]
             cursor.execute(sql, values)
-            print(f"Updated company: {data_to_insert.get('name', 'N/A')} (ID: {company_id})")
+            logger.debug(f"Updated company: {data_to_insert.get('name', 'N/A')} (ID: {company_id})")
         else:
-            # Insert new company
-            cols_str = ', '.join(data_to_insert.keys())
-            placeholders = ', '.join(['?'] * len(data_to_insert))
-            sql = f"INSERT INTO companies ({cols_str}) VALUES ({placeholders})"
-            cursor.execute(sql, list(data_to_insert.values()))
+            # Insert new company through the canonical fixed-column statement;
+            # a missing last_updated falls back to CURRENT_TIMESTAMP in SQL
+            row = (tuple(company_data.get(col) for col in COMPANY_COLUMNS[:-1])
+                   + (company_data.get('last_updated'),))
+            cursor.execute(_COMPANY_INSERT_SQL, row)
             company_id = cursor.lastrowid
-            print(f"Inserted new company: {data_to_insert.get('name', 'N/A')} (ID: {company_id})")
-            
-        conn.commit()
+            logger.debug(f"Inserted new company: {data_to_insert.get('name', 'N/A')} (ID: {company_id})")
+
+        if commit and not conn.in_transaction:
+            conn.commit()
     except sqlite3.Error as e:
         print(f"Error adding/updating company: {e}")
+        if not commit or conn.in_transaction:
+            raise # Let the caller's transaction handling roll back the batch
         conn.rollback()
         company_id = None # Ensure None is returned on error
     finally:
-        if cursor:
+        if own_cursor and cursor:
             cursor.close()
-            
+
     return company_id
 
 def get_company_by_ticker(conn, ticker_symbol):
     """Retrieves a company by its ticker symbol."""
     if not conn or not ticker_symbol:
         return None
-    cursor = conn.cursor()
     try:
-        cursor.execute("SELECT * FROM companies WHERE ticker_symbol = ?", (ticker_symbol,))
-        return cursor.fetchone() # Returns a Row object or None
+        # conn.execute reuses the connection's internal cursor machinery
+        # instead of paying a Cursor() create/close cycle per call
+        return conn.execute("SELECT * FROM companies WHERE ticker_symbol = ?",
+                            (ticker_symbol,)).fetchone() # Row object or None
     except sqlite3.Error as e:
         print(f"Error getting company by ticker {ticker_symbol}: {e}")
         return None
-    finally:
-        if cursor:
-            cursor.close()
+
+def get_companies_by_tickers(conn, ticker_symbols):
+    """Retrieves companies for many ticker symbols in one query per chunk.
+
+    Returns a dict mapping ticker_symbol -> Row; tickers with no match are
+    simply absent. The IN lists are chunked to stay under the SQL
+    parameter cap, like the bulk-insert helpers below.
+    """
+    if not conn or not ticker_symbols:
+        return {}
+    companies = {}
+    try:
+        for chunk in _chunked(list(ticker_symbols), 1):
+            placeholders = ", ".join("?" * len(chunk))
+            cursor = conn.execute(
+                f"SELECT * FROM companies WHERE ticker_symbol IN ({placeholders})",
+                chunk)
+            companies.update((row["ticker_symbol"], row) for row in cursor)
+        return companies
+    except sqlite3.Error as e:
+        print(f"Error getting companies by tickers: {e}")
+        return {}
 
 def get_company_by_name(conn, name):
     """Retrieves a company by its name."""
     if not conn or not name:
         return None
-    cursor = conn.cursor()
     try:
-        cursor.execute("SELECT * FROM companies WHERE name = ?", (name,))
-        return cursor.fetchone() # Returns a Row object or None
+        return conn.execute("SELECT * FROM companies WHERE name = ?",
+                            (name,)).fetchone() # Row object or None
     except sqlite3.Error as e:
         print(f"Error getting company by name {name}: {e}")
         return None
-    finally:
-        if cursor:
-            cursor.close()
 
 # --- Placeholder functions for other tables (to be implemented similarly) ---
 
+# Fixed column order and precomputed statement for add_company_officers.
+# Constant SQL text stays in the statement cache, and tuple rows skip the
+# per-officer dict construction the old code paid.
+_OFFICER_COLUMNS = (
+    'company_id', 'name', 'title', 'age', 'year_born', 'fiscal_year',
+    'total_pay', 'exercised_value', 'unexercised_value', 'last_updated'
+)
+_OFFICER_INSERT_SQL = (f"INSERT INTO company_officers ({', '.join(_OFFICER_COLUMNS)}) "
+                       f"VALUES ({', '.join('?' * (len(_OFFICER_COLUMNS) - 1))}, "
+                       f"CURRENT_TIMESTAMP)")
+
 def add_company_officers(conn, company_id, officers_data):
     """Adds officer data for a specific company, clearing old data first."""
     if not conn or not company_id or not officers_data:
         return False
-    cursor = conn.cursor()
+    own_txn = not conn.in_transaction
     try:
+        # Delete + re-insert must stay atomic now that the connection runs in
+        # autocommit mode; inside a caller's transaction they simply join it
+        if own_txn:
+            conn.execute("BEGIN IMMEDIATE;")
+
         # Clear existing officers for this company
-        cursor.execute("DELETE FROM company_officers WHERE company_id = ?", (company_id,))
-        
-        # Insert new officers
-        officer_cols = ['name', 'title', 'age', 'year_born', 'fiscal_year', 'total_pay', 'exercised_value', 'unexercised_value']
-        rows_to_insert = []
-        for officer in officers_data:
-            row = {'company_id': company_id, 'last_updated': datetime.now()}
-            row.update({col: officer.get(col) for col in officer_cols if col in officer})
-            rows_to_insert.append(row)
-
-        if rows_to_insert:
-            cols_str = ', '.join(rows_to_insert[0].keys())
-            placeholders = ', '.join(['?'] * len(rows_to_insert[0]))
-            sql = f"INSERT INTO company_officers ({cols_str}) VALUES ({placeholders})"
-            values_list = [list(row.values()) for row in rows_to_insert]
-            cursor.executemany(sql, values_list)
-            
-        conn.commit()
+        conn.execute("DELETE FROM company_officers WHERE company_id = ?", (company_id,))
+
+        # Insert new officers as tuples in _OFFICER_COLUMNS order; the
+        # last_updated timestamp comes from CURRENT_TIMESTAMP in the SQL
+        # text, so no datetime objects are allocated or adapted per row
+        rows_to_insert = [
+            (company_id, officer.get('name'), officer.get('title'),
+             officer.get('age'), officer.get('year_born'), officer.get('fiscal_year'),
+             officer.get('total_pay'), officer.get('exercised_value'),
+             officer.get('unexercised_value'))
+            for officer in officers_data
+        ]
+        conn.executemany(_OFFICER_INSERT_SQL, rows_to_insert)
+
+        if own_txn:
+            conn.commit()
         print(f"Added/Updated {len(rows_to_insert)} officers for company ID: {company_id}")
         return True
     except sqlite3.Error as e:
         print(f"Error adding company officers: {e}")
+        if not own_txn:
+            raise # Let the caller's transaction manager roll back the batch
         conn.rollback()
         return False
-    finally:
-        if cursor:
-            cursor.close()
 
-def add_news_article(conn, article_data):
-    """Adds a news article, avoiding duplicates based on source_url."""
+# Canonical single-row news insert in NEWS_ARTICLE_COLUMNS order. INSERT OR
+# IGNORE lets the UNIQUE index on source_url reject duplicates at B-tree
+# level instead of a SELECT round trip before every insert.
+_NEWS_ARTICLE_INSERT_SQL = (f"INSERT OR IGNORE INTO news_articles ({', '.join(NEWS_ARTICLE_COLUMNS)}) "
+                            f"VALUES ({', '.join('?' * (len(NEWS_ARTICLE_COLUMNS) - 1))}, "
+                            f"COALESCE(?, CURRENT_TIMESTAMP))")
+
+def add_news_article(conn, article_data, commit=True):
+    """Adds a news article, avoiding duplicates based on source_url.
+
+    Dedup is delegated to the UNIQUE constraint via INSERT OR IGNORE: the
+    common new-article path is one statement, and only an actual duplicate
+    pays the follow-up SELECT for the existing id. Callers inserting many
+    articles should use bulk_add_news_articles instead.
+    """
     if not conn or not article_data or not article_data.get('source_url'):
         return None
-    cursor = conn.cursor()
     article_id = None
     try:
-        # Check if article exists by URL
-        cursor.execute("SELECT article_id FROM news_articles WHERE source_url = ?", (article_data['source_url'],))
-        result = cursor.fetchone()
-        if result:
-            print(f"Article already exists: {article_data['source_url']}")
-            return result['article_id']
-
-        # Insert new article
-        columns = ['company_id', 'industry', 'topic', 'title', 'source_name', 'source_url', 
-                   'published_date', 'summary', 'sentiment_score', 'sentiment_label', 'collected_date']
-        data_to_insert = {col: article_data.get(col) for col in columns if col in article_data}
-        data_to_insert['collected_date'] = data_to_insert.get('collected_date', datetime.now())
-        
-        cols_str = ', '.join(data_to_insert.keys())
-        placeholders = ', '.join(['?'] * len(data_to_insert))
-        sql = f"INSERT INTO news_articles ({cols_str}) VALUES ({placeholders})"
-        cursor.execute(sql, list(data_to_insert.values()))
-        article_id = cursor.lastrowid
-        conn.commit()
-        print(f"Added news article: {article_data.get('title', 'N/A')} (ID: {article_id})")
+        row = tuple(article_data.get(col) for col in NEWS_ARTICLE_COLUMNS)
+        cursor = conn.execute(_NEWS_ARTICLE_INSERT_SQL, row)
+        if cursor.rowcount:
+            article_id = cursor.lastrowid
+            logger.debug(f"Added news article: {article_data.get('title', 'N/A')} (ID: {article_id})")
+        else:
+            # Duplicate source_url: resolve the existing article's id
+            result = conn.execute("SELECT article_id FROM news_articles WHERE source_url = ?",
+                                  (article_data['source_url'],)).fetchone()
+            logger.debug(f"Article already exists: {article_data['source_url']}")
+            return result['article_id'] if result else None
+        if commit and not conn.in_transaction:
+            conn.commit()
     except sqlite3.Error as e:
         print(f"Error adding news article: {e}")
+        if not commit or conn.in_transaction:
+            raise
         conn.rollback()
         article_id = None
-    finally:
-        if cursor:
-            cursor.close()
     return article_id
 
 def add_or_update_icp(conn, profile_name, criteria_json):
@@ -420,40 +648,36 @@ def add_or_update_icp(conn, profile_name, criteria_json):
     if not conn or not profile_name or not criteria_json:
         return None
         
-    cursor = conn.cursor()
     icp_id = None
     try:
         # Check if the ICP profile already exists
-        cursor.execute("SELECT icp_id FROM icps WHERE profile_name = ?", (profile_name,))
-        result = cursor.fetchone()
-        
-        now = datetime.now()
+        result = conn.execute("SELECT icp_id FROM icps WHERE profile_name = ?",
+                              (profile_name,)).fetchone()
         
         if result:
             # Update existing ICP
             icp_id = result['icp_id']
-            cursor.execute(
-                "UPDATE icps SET criteria_json = ?, last_used = ? WHERE icp_id = ?",
-                (criteria_json, now, icp_id)
+            conn.execute(
+                "UPDATE icps SET criteria_json = ?, last_used = CURRENT_TIMESTAMP WHERE icp_id = ?",
+                (criteria_json, icp_id)
             )
             print(f"Updated ICP profile: {profile_name} (ID: {icp_id})")
         else:
             # Insert new ICP
-            cursor.execute(
-                "INSERT INTO icps (profile_name, criteria_json, created_at, last_used) VALUES (?, ?, ?, ?)",
-                (profile_name, criteria_json, now, now)
-            )
-            icp_id = cursor.lastrowid
+            # created_at fires from its column default
+            icp_id = conn.execute(
+                "INSERT INTO icps (profile_name, criteria_json, last_used) VALUES (?, ?, CURRENT_TIMESTAMP)",
+                (profile_name, criteria_json)
+            ).lastrowid
             print(f"Created new ICP profile: {profile_name} (ID: {icp_id})")
-            
-        conn.commit()
+
+        if not conn.in_transaction:
+            conn.commit()
     except sqlite3.Error as e:
         print(f"Error adding/updating ICP profile: {e}")
-        conn.rollback()
+        if conn.in_transaction:
+            raise # Let the caller's transaction manager roll back the batch
         icp_id = None
-    finally:
-        if cursor:
-            cursor.close()
             
     return icp_id
 
@@ -469,17 +693,16 @@ def get_icp_by_name(conn, profile_name):
     """
     if not conn or not profile_name:
         return None
-    cursor = conn.cursor()
     try:
-        cursor.execute("SELECT * FROM icps WHERE profile_name = ?", (profile_name,))
-        result = cursor.fetchone()
+        result = conn.execute("SELECT * FROM icps WHERE profile_name = ?",
+                              (profile_name,)).fetchone()
         
         if result:
-            # Update last_used timestamp
-            now = datetime.now()
-            cursor.execute("UPDATE icps SET last_used = ? WHERE icp_id = ?", 
-                           (now, result['icp_id']))
-            conn.commit()
+            # Update last_used timestamp server-side
+            conn.execute("UPDATE icps SET last_used = CURRENT_TIMESTAMP WHERE icp_id = ?",
+                         (result['icp_id'],))
+            if not conn.in_transaction:
+                conn.commit()
             print(f"Retrieved ICP profile: {profile_name} (ID: {result['icp_id']})")
         else:
             print(f"ICP profile not found: {profile_name}")
@@ -488,54 +711,49 @@ def get_icp_by_name(conn, profile_name):
     except sqlite3.Error as e:
         print(f"Error retrieving ICP profile: {e}")
         return None
-    finally:
-        if cursor:
-            cursor.close()
+
+# Canonical fixed-column lead insert; status and collected_date sit last so
+# their defaults can be filled in without rebuilding the SQL text.
+_LEAD_COLUMNS = (
+    'icp_id', 'company_name', 'contact_name', 'job_title', 'industry',
+    'company_size', 'region', 'website', 'email', 'phone', 'linkedin_profile',
+    'source', 'qualification_status', 'qualification_reason', 'score',
+    'engagement_level', 'technologies_used', 'notes', 'status', 'collected_date'
+)
+_LEAD_INSERT_SQL = (f"INSERT INTO leads ({', '.join(_LEAD_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * (len(_LEAD_COLUMNS) - 1))}, "
+                    f"COALESCE(?, CURRENT_TIMESTAMP))")
 
 def add_lead(conn, lead_data):
     """Adds a new lead.
-    
+
     Args:
         conn: Database connection
         lead_data: Dictionary containing lead data
-        
+
     Returns:
         The lead ID (int) if successful, None otherwise
     """
     if not conn or not lead_data:
         return None
-        
-    cursor = conn.cursor()
+
     lead_id = None
     try:
-        # Define valid columns based on the table schema
-        columns = [
-            'icp_id', 'company_name', 'contact_name', 'job_title', 'industry',
-            'company_size', 'region', 'website', 'email', 'phone', 'linkedin_profile',
-            'source', 'qualification_status', 'qualification_reason', 'score',
-            'engagement_level', 'technologies_used', 'notes', 'status'
-        ]
-        
-        # Prepare data with only valid columns
-        data_to_insert = {col: lead_data.get(col) for col in columns if col in lead_data}
-        data_to_insert['collected_date'] = lead_data.get('collected_date', datetime.now())
-        
-        # Insert the lead
-        cols_str = ', '.join(data_to_insert.keys())
-        placeholders = ', '.join(['?'] * len(data_to_insert))
-        sql = f"INSERT INTO leads ({cols_str}) VALUES ({placeholders})"
-        cursor.execute(sql, list(data_to_insert.values()))
-        lead_id = cursor.lastrowid
-        
-        conn.commit()
-        print(f"Added new lead: {data_to_insert.get('company_name', 'N/A')} - {data_to_insert.get('contact_name', 'N/A')} (ID: {lead_id})")
+        # Insert through the canonical fixed-column statement; the dict.get
+        # defaults reproduce what the column defaults used to supply when a
+        # field was omitted from the dynamic column list
+        row = (tuple(lead_data.get(col) for col in _LEAD_COLUMNS[:-2])
+               + (lead_data.get('status', 'New'), lead_data.get('collected_date')))
+        lead_id = conn.execute(_LEAD_INSERT_SQL, row).lastrowid
+
+        if not conn.in_transaction:
+            conn.commit()
+        logger.debug(f"Added new lead: {lead_data.get('company_name', 'N/A')} - {lead_data.get('contact_name', 'N/A')} (ID: {lead_id})")
     except sqlite3.Error as e:
         print(f"Error adding lead: {e}")
-        conn.rollback()
+        if conn.in_transaction:
+            raise # Let the caller's transaction manager roll back the batch
         lead_id = None
-    finally:
-        if cursor:
-            cursor.close()
             
     return lead_id
 
@@ -552,8 +770,7 @@ def update_lead(conn, lead_id, lead_data):
     """
     if not conn or not lead_id or not lead_data:
         return False
-        
-    cursor = conn.cursor()
+
     try:
         # Define valid columns based on the table schema
         columns = [
@@ -574,130 +791,339 @@ def update_lead(conn, lead_id, lead_data):
         update_cols = [f"{col} = ?" for col in data_to_update.keys()]
         sql = f"UPDATE leads SET {', '.join(update_cols)} WHERE lead_id = ?"
         values = list(data_to_update.values()) + [lead_id]
-        cursor.execute(sql, values)
-        
-        if cursor.rowcount == 0:
+
+        if conn.execute(sql, values).rowcount == 0:
             print(f"Lead ID {lead_id} not found or no changes made")
             return False
-            
-        conn.commit()
+
+        if not conn.in_transaction:
+            conn.commit()
         print(f"Updated lead ID: {lead_id}")
         return True
     except sqlite3.Error as e:
         print(f"Error updating lead: {e}")
-        conn.rollback()
+        if conn.in_transaction:
+            raise # Let the caller's transaction manager roll back the batch
         return False
-    finally:
-        if cursor:
-            cursor.close()
 
 def add_market_trend(conn, trend_data):
     """Adds a market trend."""
     # ... implementation ...
     pass
 
-def add_india_real_estate_project(conn, project_data):
-    """Adds an India real estate project, avoiding duplicates based on RERA ID or name+developer."""
+# Canonical single-row inserts for the India tables. INSERT OR IGNORE lets
+# the unique indexes (rera_registration_id, project_name+developer_name,
+# firm_name, coa_registration_id) reject duplicates at B-tree level, so the
+# old two-SELECTs-then-INSERT pattern collapses to one statement on the
+# common path.
+_PROJECT_INSERT_SQL = (f"INSERT OR IGNORE INTO india_real_estate_projects ({', '.join(PROJECT_COLUMNS)}) "
+                       f"VALUES ({', '.join('?' * (len(PROJECT_COLUMNS) - 1))}, "
+                       f"COALESCE(?, CURRENT_TIMESTAMP))")
+_FIRM_INSERT_SQL = (f"INSERT OR IGNORE INTO india_architectural_firms ({', '.join(FIRM_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * (len(FIRM_COLUMNS) - 1))}, "
+                    f"COALESCE(?, CURRENT_TIMESTAMP))")
+
+def add_india_real_estate_project(conn, project_data, commit=True):
+    """Adds an India real estate project, avoiding duplicates based on RERA ID or name+developer.
+
+    Dedup is delegated to the unique indexes via INSERT OR IGNORE; only an
+    actual duplicate pays a SELECT to resolve the existing project id.
+    """
     if not conn or not project_data:
         return None
-    cursor = conn.cursor()
     project_id = None
     try:
-        # Check for duplicates based on RERA ID if available
-        rera_id = project_data.get("rera_registration_id")
-        if rera_id:
-            cursor.execute("SELECT project_id FROM india_real_estate_projects WHERE rera_registration_id = ?", (rera_id,))
-            result = cursor.fetchone()
+        row = tuple(project_data.get(col) for col in PROJECT_COLUMNS)
+        cursor = conn.execute(_PROJECT_INSERT_SQL, row)
+        if cursor.rowcount:
+            project_id = cursor.lastrowid
+            logger.debug(f"Added India real estate project: {project_data.get('project_name', 'N/A')} (ID: {project_id})")
+            if commit and not conn.in_transaction:
+                conn.commit()
+        else:
+            # Duplicate: resolve the existing id on whichever key matched
+            rera_id = project_data.get("rera_registration_id")
+            if rera_id:
+                result = conn.execute("SELECT project_id FROM india_real_estate_projects WHERE rera_registration_id = ?",
+                                      (rera_id,)).fetchone()
+                if result:
+                    logger.debug(f"Real estate project with RERA ID {rera_id} already exists.")
+                    return result["project_id"]
+            result = conn.execute("SELECT project_id FROM india_real_estate_projects WHERE project_name = ? AND developer_name = ?",
+                                  (project_data.get("project_name"), project_data.get("developer_name"))).fetchone()
             if result:
-                print(f"Real estate project with RERA ID {rera_id} already exists.")
-                return result["project_id"]
-        
-        # Check for duplicates based on name and developer name if RERA ID is not present or not found
-        project_name = project_data.get("project_name")
-        developer_name = project_data.get("developer_name")
-        if project_name and developer_name:
-             cursor.execute("SELECT project_id FROM india_real_estate_projects WHERE project_name = ? AND developer_name = ?", (project_name, developer_name))
-             result = cursor.fetchone()
-             if result:
-                print(f"Real estate project {project_name} by {developer_name} already exists.")
+                logger.debug(f"Real estate project {project_data.get('project_name')} already exists.")
                 return result["project_id"]
-
-        # Insert new project
-        columns = [
-            "project_name", "developer_id", "developer_name", "city", "region", 
-            "project_type", "status", "rera_registration_id", "launch_date", 
-            "expected_completion_date", "total_area_sqft", "price_per_sqft_range", 
-            "key_features", "source_url", "collected_date"
-        ]
-        data_to_insert = {col: project_data.get(col) for col in columns if col in project_data}
-        data_to_insert["collected_date"] = data_to_insert.get("collected_date", datetime.now())
-        
-        cols_str = ", ".join(data_to_insert.keys())
-        placeholders = ", ".join(["?"] * len(data_to_insert))
-        sql = f"INSERT INTO india_real_estate_projects ({cols_str}) VALUES ({placeholders})"
-        cursor.execute(sql, list(data_to_insert.values()))
-        project_id = cursor.lastrowid
-        conn.commit()
-        print(f"Added India real estate project: {project_data.get('project_name', 'N/A')} (ID: {project_id})")
     except sqlite3.Error as e:
         print(f"Error adding India real estate project: {e}")
+        if not commit or conn.in_transaction:
+            raise
         conn.rollback()
         project_id = None
-    finally:
-        if cursor:
-            cursor.close()
     return project_id
 
-def add_india_architectural_firm(conn, firm_data):
-    """Adds an India architectural firm, avoiding duplicates based on firm name or COA registration ID."""
+def add_india_architectural_firm(conn, firm_data, commit=True):
+    """Adds an India architectural firm, avoiding duplicates based on firm name or COA registration ID.
+
+    Dedup is delegated to the unique indexes via INSERT OR IGNORE; only an
+    actual duplicate pays a SELECT to resolve the existing firm id.
+    """
     if not conn or not firm_data:
         return None
-    cursor = conn.cursor()
     firm_id = None
     try:
-        # Check for duplicates based on COA registration ID if available
-        coa_id = firm_data.get("coa_registration_id")
-        if coa_id:
-            cursor.execute("SELECT firm_id FROM india_architectural_firms WHERE coa_registration_id = ?", (coa_id,))
-            result = cursor.fetchone()
-            if result:
-                print(f"Architectural firm with COA ID {coa_id} already exists.")
-                return result["firm_id"]
-        
-        # Check for duplicates based on firm name
-        firm_name = firm_data.get("firm_name")
-        if firm_name:
-            cursor.execute("SELECT firm_id FROM india_architectural_firms WHERE firm_name = ?", (firm_name,))
-            result = cursor.fetchone()
+        row = tuple(firm_data.get(col) for col in FIRM_COLUMNS)
+        cursor = conn.execute(_FIRM_INSERT_SQL, row)
+        if cursor.rowcount:
+            firm_id = cursor.lastrowid
+            logger.debug(f"Added India architectural firm: {firm_data.get('firm_name', 'N/A')} (ID: {firm_id})")
+            if commit and not conn.in_transaction:
+                conn.commit()
+        else:
+            # Duplicate: resolve the existing id on whichever key matched
+            coa_id = firm_data.get("coa_registration_id")
+            if coa_id:
+                result = conn.execute("SELECT firm_id FROM india_architectural_firms WHERE coa_registration_id = ?",
+                                      (coa_id,)).fetchone()
+                if result:
+                    logger.debug(f"Architectural firm with COA ID {coa_id} already exists.")
+                    return result["firm_id"]
+            result = conn.execute("SELECT firm_id FROM india_architectural_firms WHERE firm_name = ?",
+                                  (firm_data.get("firm_name"),)).fetchone()
             if result:
-                print(f"Architectural firm {firm_name} already exists.")
+                logger.debug(f"Architectural firm {firm_data.get('firm_name')} already exists.")
                 return result["firm_id"]
-
-        # Insert new firm
-        columns = [
-            "company_id", "firm_name", "city", "region", "specialization", 
-            "notable_projects", "key_personnel", "awards", "coa_registration_id", 
-            "source_url", "collected_date"
-        ]
-        data_to_insert = {col: firm_data.get(col) for col in columns if col in firm_data}
-        data_to_insert["collected_date"] = data_to_insert.get("collected_date", datetime.now())
-        
-        cols_str = ", ".join(data_to_insert.keys())
-        placeholders = ", ".join(["?"] * len(data_to_insert))
-        sql = f"INSERT INTO india_architectural_firms ({cols_str}) VALUES ({placeholders})"
-        cursor.execute(sql, list(data_to_insert.values()))
-        firm_id = cursor.lastrowid
-        conn.commit()
-        print(f"Added India architectural firm: {firm_data.get('firm_name', 'N/A')} (ID: {firm_id})")
     except sqlite3.Error as e:
         print(f"Error adding India architectural firm: {e}")
+        if not commit or conn.in_transaction:
+            raise
         conn.rollback()
         firm_id = None
-    finally:
-        if cursor:
-            cursor.close()
     return firm_id
 
+# SQLite caps the parameters per statement (SQLITE_MAX_VARIABLE_NUMBER,
+# 999 in older builds), so the bulk helpers feed executemany and the IN (...)
+# lookups in chunks of at most 900 parameters. All chunks for one call run
+# inside the caller's single transaction, so chunk boundaries never force
+# intermediate commits.
+_MAX_SQL_PARAMS = 900
+
+def _chunked(rows, ncols):
+    """Yields lists of rows sized to stay under the SQL parameter cap."""
+    chunk_size = max(1, _MAX_SQL_PARAMS // ncols)
+    it = iter(rows)
+    return iter(lambda: list(islice(it, chunk_size)), [])
+
+def bulk_add_companies(conn, companies_data, commit=True):
+    """Adds or refreshes many companies in a single executemany batch.
+
+    Uses a SQLite UPSERT: rows whose name already exists get their data
+    refreshed in place, so there is no per-row SELECT-then-INSERT/UPDATE
+    round trip. A ticker_symbol collision on a differently-named row is
+    ignored rather than raised. Returns a name -> company_id map built with
+    one follow-up SELECT, so callers linking related rows do not need a
+    round trip per company.
+    """
+    if not conn or not companies_data:
+        return {}
+    cursor = conn.cursor()
+    # This cursor's reads stay internal, so skip the sqlite3.Row wrapper:
+    # plain tuples are cheaper per row and feed the id map directly
+    cursor.row_factory = None
+    try:
+        columns = COMPANY_COLUMNS
+        now = datetime.now()
+        values_list = []
+        for company in companies_data:
+            if isinstance(company, dict):
+                # Project to a tuple in column order; last_updated is the
+                # final column.
+                row = (tuple(company.get(col) for col in columns[:-1])
+                       + (company.get('last_updated', now),))
+            else:
+                # Already a namedtuple/sequence in COMPANY_COLUMNS order
+                row = tuple(company)
+                if row[-1] is None:
+                    row = row[:-1] + (now,)
+            if not row[0]: # name is the first column
+                continue
+            values_list.append(row)
+
+        affected = 0
+        if values_list:
+            for chunk in _chunked(values_list, len(columns)):
+                cursor.executemany(_COMPANY_UPSERT_SQL, chunk)
+                affected += cursor.rowcount
+
+        # One SELECT per chunk resolves the ids instead of reading lastrowid
+        # per insert.
+        names = [row[0] for row in values_list]
+        company_ids = {}
+        for chunk in _chunked(names, 1):
+            name_placeholders = ', '.join(['?'] * len(chunk))
+            cursor.execute(f"SELECT name, company_id FROM companies WHERE name IN ({name_placeholders})", chunk)
+            company_ids.update(cursor.fetchall())
+
+        if commit and not conn.in_transaction:
+            conn.commit()
+        print(f"Upserted {affected} of {len(values_list)} companies.")
+        return company_ids
+    except sqlite3.Error as e:
+        print(f"Error bulk-adding companies: {e}")
+        if not commit or conn.in_transaction:
+            raise
+        conn.rollback()
+        return {}
+
+def bulk_add_india_architectural_firms(conn, firms_data, commit=True):
+    """Adds many architectural firms in a single executemany batch.
+
+    Firms whose firm_name or coa_registration_id already exists are skipped,
+    mirroring the per-row dedup checks in add_india_architectural_firm.
+    Returns the number of rows inserted.
+    """
+    if not conn or not firms_data:
+        return 0
+    cursor = conn.cursor()
+    cursor.row_factory = None # Internal dedup scan; plain tuples suffice
+    try:
+        cursor.execute("SELECT firm_name, coa_registration_id FROM india_architectural_firms")
+        existing = cursor.fetchall()
+        existing_names = {name for name, _ in existing}
+        existing_coa_ids = {coa for _, coa in existing if coa}
+
+        columns = FIRM_COLUMNS
+        name_idx = columns.index("firm_name")
+        coa_idx = columns.index("coa_registration_id")
+        now = datetime.now()
+        values_list = []
+        for firm in firms_data:
+            if isinstance(firm, dict):
+                row = (tuple(firm.get(col) for col in columns[:-1])
+                       + (firm.get("collected_date", now),))
+            else:
+                # Already a namedtuple/sequence in FIRM_COLUMNS order
+                row = tuple(firm)
+                if row[-1] is None:
+                    row = row[:-1] + (now,)
+            if row[name_idx] in existing_names:
+                continue
+            if row[coa_idx] in existing_coa_ids:
+                continue
+            values_list.append(row)
+
+        inserted = 0
+        if values_list:
+            # OR IGNORE defers to the unique indexes (firm_name,
+            # coa_registration_id), catching duplicates within the batch
+            # that the pre-scan above cannot see
+            for chunk in _chunked(values_list, len(columns)):
+                cursor.executemany(_FIRM_INSERT_SQL, chunk)
+                inserted += cursor.rowcount
+        if commit and not conn.in_transaction:
+            conn.commit()
+        print(f"Bulk-inserted {inserted} architectural firms ({len(firms_data) - inserted} already present).")
+        return inserted
+    except sqlite3.Error as e:
+        print(f"Error bulk-adding architectural firms: {e}")
+        if not commit or conn.in_transaction:
+            raise
+        conn.rollback()
+        return 0
+
+def bulk_add_india_real_estate_projects(conn, projects_data, commit=True):
+    """Adds many real estate projects in a single executemany batch.
+
+    Duplicates are skipped on rera_registration_id (UNIQUE constraint, via
+    INSERT OR IGNORE) and on project_name + developer_name, mirroring the
+    per-row checks in add_india_real_estate_project. Returns the number of
+    rows inserted.
+    """
+    if not conn or not projects_data:
+        return 0
+    cursor = conn.cursor()
+    cursor.row_factory = None # Internal dedup scan; plain tuples suffice
+    try:
+        cursor.execute("SELECT project_name, developer_name FROM india_real_estate_projects")
+        existing_pairs = set(cursor.fetchall())
+
+        columns = PROJECT_COLUMNS
+        name_idx = columns.index("project_name")
+        developer_idx = columns.index("developer_name")
+        now = datetime.now()
+        values_list = []
+        for project in projects_data:
+            if isinstance(project, dict):
+                row = (tuple(project.get(col) for col in columns[:-1])
+                       + (project.get("collected_date", now),))
+            else:
+                # Already a namedtuple/sequence in PROJECT_COLUMNS order
+                row = tuple(project)
+                if row[-1] is None:
+                    row = row[:-1] + (now,)
+            if (row[name_idx], row[developer_idx]) in existing_pairs:
+                continue
+            values_list.append(row)
+
+        inserted = 0
+        if values_list:
+            for chunk in _chunked(values_list, len(columns)):
+                cursor.executemany(_PROJECT_INSERT_SQL, chunk)
+                inserted += cursor.rowcount
+        if commit and not conn.in_transaction:
+            conn.commit()
+        print(f"Bulk-inserted {inserted} real estate projects ({len(projects_data) - inserted} already present).")
+        return inserted
+    except sqlite3.Error as e:
+        print(f"Error bulk-adding real estate projects: {e}")
+        if not commit or conn.in_transaction:
+            raise
+        conn.rollback()
+        return 0
+
+def bulk_add_news_articles(conn, articles_data, commit=True):
+    """Adds many news articles in a single executemany batch.
+
+    Duplicates are skipped on source_url via INSERT OR IGNORE (the column has
+    a UNIQUE constraint). Returns the number of rows inserted.
+    """
+    if not conn or not articles_data:
+        return 0
+    cursor = conn.cursor()
+    try:
+        columns = NEWS_ARTICLE_COLUMNS
+        url_idx = columns.index("source_url")
+        now = datetime.now()
+        values_list = []
+        for article in articles_data:
+            if isinstance(article, dict):
+                row = (tuple(article.get(col) for col in columns[:-1])
+                       + (article.get("collected_date", now),))
+            else:
+                # Already a namedtuple/sequence in NEWS_ARTICLE_COLUMNS order
+                row = tuple(article)
+                if row[-1] is None:
+                    row = row[:-1] + (now,)
+            if not row[url_idx]:
+                continue
+            values_list.append(row)
+
+        inserted = 0
+        if values_list:
+            for chunk in _chunked(values_list, len(columns)):
+                cursor.executemany(_NEWS_ARTICLE_INSERT_SQL, chunk)
+                inserted += cursor.rowcount
+        if commit and not conn.in_transaction:
+            conn.commit()
+        print(f"Bulk-inserted {inserted} news articles ({len(articles_data) - inserted} skipped).")
+        return inserted
+    except sqlite3.Error as e:
+        print(f"Error bulk-adding news articles: {e}")
+        if not commit or conn.in_transaction:
+            raise
+        conn.rollback()
+        return 0
+
 def add_analysis_result(conn, analysis_data):
     """Adds an analysis result."""
     # ... implementation ...
@@ -716,28 +1142,33 @@ def get_leads_by_ids(conn, lead_ids):
     if not conn or not lead_ids:
         return []
         
-    cursor = conn.cursor()
     results = []
     try:
-        # Convert lead_ids to tuple for SQL IN clause
         if isinstance(lead_ids, (list, tuple)):
-            # Format for SQL IN clause
-            id_str = ','.join('?' for _ in lead_ids)
-            query = f"SELECT * FROM leads WHERE lead_id IN ({id_str})"
-            cursor.execute(query, lead_ids)
+            # Stream the id batch through json_each as one JSON parameter:
+            # the SQL text stays constant whatever the batch size, so the
+            # statement cache keeps a single plan and there is no
+            # SQLITE_MAX_VARIABLE_NUMBER ceiling
+            try:
+                results = conn.execute(
+                    "SELECT l.* FROM leads l JOIN json_each(?) j ON l.lead_id = j.value",
+                    (json.dumps(list(lead_ids)),)).fetchall()
+            except sqlite3.OperationalError:
+                # SQLite built without the JSON functions: chunked IN lists
+                for chunk in _chunked(list(lead_ids), 1):
+                    id_str = ','.join('?' for _ in chunk)
+                    results.extend(conn.execute(
+                        f"SELECT * FROM leads WHERE lead_id IN ({id_str})", chunk))
         else:
             # Single ID case
-            cursor.execute("SELECT * FROM leads WHERE lead_id = ?", (lead_ids,))
-            
-        results = cursor.fetchall()
+            results = conn.execute("SELECT * FROM leads WHERE lead_id = ?",
+                                   (lead_ids,)).fetchall()
+
         print(f"Retrieved {len(results)} leads")
         return results
     except sqlite3.Error as e:
         print(f"Error retrieving leads by IDs: {e}")
         return []
-    finally:
-        if cursor:
-            cursor.close()
 
 def get_lead_by_company_icp(conn, company_name=None, icp_id=None):
     """Retrieves leads for a specific company matching an ICP.
@@ -752,8 +1183,7 @@ def get_lead_by_company_icp(conn, company_name=None, icp_id=None):
     """
     if not conn:
         return []
-        
-    cursor = conn.cursor()
+
     try:
         query = "SELECT * FROM leads WHERE 1=1"
         params = []
@@ -764,8 +1194,8 @@ def get_lead_by_company_icp(conn, company_name=None, icp_id=None):
             if isinstance(company_name, int) or (isinstance(company_name, str) and company_name.isdigit()):
                 # First check if we can find the company name from companies table
                 company_id = int(company_name)
-                cursor.execute("SELECT name FROM companies WHERE company_id = ?", (company_id,))
-                company_result = cursor.fetchone()
+                company_result = conn.execute("SELECT name FROM companies WHERE company_id = ?",
+                                              (company_id,)).fetchone()
                 if company_result:
                     company_name_str = company_result['name']
                     query += " AND company_name = ?"
@@ -784,9 +1214,8 @@ def get_lead_by_company_icp(conn, company_name=None, icp_id=None):
             params.append(icp_id)
         
         query += " ORDER BY score DESC, collected_date DESC"
-        
-        cursor.execute(query, params)
-        results = cursor.fetchall()
+
+        results = conn.execute(query, params).fetchall()
         
         if company_name and icp_id:
             print(f"Retrieved {len(results)} leads for company '{company_name}' with ICP ID {icp_id}")
@@ -801,9 +1230,6 @@ def get_lead_by_company_icp(conn, company_name=None, icp_id=None):
     except sqlite3.Error as e:
         print(f"Error retrieving leads by company and ICP: {e}")
         return []
-    finally:
-        if cursor:
-            cursor.close()
 
 # --- Initialization --- 
 def initialize_database():
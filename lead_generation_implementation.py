@@ -13,6 +13,28 @@ import database_manager as db_manager
 # Commenting out this import as it causes dependency issues with data_api
 # from real_data_collector import RealDataCollector # May need collector for enriching prospect data
 
+def _score_leads(features, weights):
+    """Score leads as the weighted sum of their feature columns.
+
+    Takes a 2-D float array of lead features (leads x criteria) and a 1-D
+    weight vector, and returns one score per lead. LeadQualifier builds the
+    feature matrix from its ICP criterion matches and calls this once per
+    batch of prospects instead of scoring each dict individually.
+    """
+    scores = np.empty(features.shape[0])
+    for i in range(features.shape[0]):
+        scores[i] = np.dot(features[i], weights)
+    return scores
+
+# JIT-compile the scoring kernel when numba is available; the explicit loop
+# above lets LLVM vectorize it. numba is optional, so the pure-numpy version
+# stays the fallback.
+try:
+    import numba
+    _score_leads = numba.njit(cache=True, fastmath=True)(_score_leads)
+except ImportError:
+    pass
+
 class LeadGenerationAgent:
     """Main class for the Lead Generation functionality using real data."""
     
@@ -212,8 +234,12 @@ class LeadQualifier:
         """Qualify prospects (company dicts) against the ICP and update/create lead records in DB."""
         print(f"Qualifying {len(prospects)} prospects against ICP ID: {icp_id}...")
         qualified_lead_ids = []
-        
-        for prospect_company in prospects:
+
+        # Score the whole batch in one pass through the _score_leads kernel
+        # before the per-prospect DB work below.
+        scores = self._score_prospects(prospects, icp_criteria)
+
+        for prospect_company, score in zip(prospects, scores):
             company_id = prospect_company["company_id"]
             
             # Check if a lead record already exists for this company and ICP
@@ -221,8 +247,6 @@ class LeadQualifier:
             # Use first result if exists, otherwise None
             existing_lead = existing_leads[0] if existing_leads and len(existing_leads) > 0 else None
             
-            # Calculate score based on company data vs ICP criteria
-            score = self._calculate_score(prospect_company, icp_criteria)
             qualification_status, reason = self._check_qualification(prospect_company, icp_criteria, score)
             
             lead_data = {
@@ -284,37 +308,49 @@ class LeadQualifier:
         else:
             return "Disqualified", reason
 
-    def _calculate_score(self, prospect_company, icp_criteria):
-        """Calculate a score based on how well the prospect company matches the ICP."""
-        score = 0.0
-        max_score = 0.0
-        
+    def _feature_row(self, prospect_company, icp_criteria):
+        """Return 0/1 match values for each scoring criterion present in the ICP."""
+        row = []
+
         if "preferred_industries" in icp_criteria:
-            max_score += 1
-            if prospect_company.get("industry") in icp_criteria["preferred_industries"]:
-                score += 1
-        
+            row.append(1.0 if prospect_company.get("industry") in icp_criteria["preferred_industries"] else 0.0)
+
         if "preferred_regions" in icp_criteria:
-            max_score += 1
-            if prospect_company.get("region") in icp_criteria["preferred_regions"]:
-                score += 1
-        
-        # Score based on company size (employee count)
+            row.append(1.0 if prospect_company.get("region") in icp_criteria["preferred_regions"] else 0.0)
+
+        # Match on company size (employee count)
         if "preferred_company_sizes" in icp_criteria:
-            max_score += 1
-            # Create a new instance with the current db connection instead of None
             min_emp, max_emp = self._get_employee_range_for_scoring(icp_criteria["preferred_company_sizes"])
             emp_count = prospect_company.get("employee_count")
-            if emp_count is not None:
-                if (min_emp is None or emp_count >= min_emp) and (max_emp is None or emp_count <= max_emp):
-                    score += 1
-                
+            matched = (emp_count is not None
+                       and (min_emp is None or emp_count >= min_emp)
+                       and (max_emp is None or emp_count <= max_emp))
+            row.append(1.0 if matched else 0.0)
+
         # TODO: Add scoring based on technologies used (requires collecting this data)
         # TODO: Add scoring based on engagement level (requires collecting this data)
         # TODO: Add scoring based on job titles (requires finding contacts)
 
-        normalized_score = (score / max_score) if max_score > 0 else 0
-        return round(normalized_score, 2)
+        return row
+
+    def _score_prospects(self, prospects, icp_criteria):
+        """Score a batch of prospects against the ICP, one pass through _score_leads.
+
+        Builds the prospects x criteria feature matrix, weights every active
+        criterion equally so the weighted sum is already normalized to [0, 1],
+        and returns one rounded score per prospect.
+        """
+        if not prospects:
+            return []
+
+        features = np.array([self._feature_row(p, icp_criteria) for p in prospects], dtype=np.float64)
+        if features.size == 0:
+            # No scoring criteria in the ICP; same 0 score as before.
+            return [0 for _ in prospects]
+
+        weights = np.full(features.shape[1], 1.0 / features.shape[1])
+        scores = _score_leads(features, weights)
+        return [round(float(s), 2) for s in scores]
     
     # Added this method to avoid creating a temporary ProspectIdentifier with None
     def _get_employee_range_for_scoring(self, size_strings):